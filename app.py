@@ -1,11 +1,104 @@
 import streamlit as st
 import os
-from dotenv import load_dotenv
-from src.personas import list_journalists, load_journalist
-from src.evaluation import calculate_response_likelihood, evaluate_pitch_with_ai
+import re
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Tuple
+from src.personas import list_journalists_with_meta, load_journalist
+
+
+@st.cache_resource(show_spinner=False)
+def load_environment() -> None:
+    """Load .env once per process; os.environ persists across reruns and sessions."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
 
 # Load environment variables
-load_dotenv()
+load_environment()
+
+# Pitch-factor term groups (substring matches on the lowercased pitch), scanned in one pass
+PITCH_FACTOR_TERMS = (
+    ("exclusive", ("exclusive",)),
+    ("breaking", ("breaking",)),
+    ("embargo", ("embargo",)),
+    ("data", ("data", "study", "research", "survey")),
+    ("research", ("data", "study", "research")),
+    ("executive", ("ceo", "founder", "executive")),
+    ("beat", ("enterprise", "software", "saas", "b2b", "security", "technology", "startup")),
+)
+KEYWORD_GROUP_PREFIX = "keyword:"
+
+# Likelihood buckets: values at or above each threshold move up one bucket
+ASSESSMENT_THRESHOLDS = (0.3, 0.5, 0.7)
+ASSESSMENT_LABELS = (
+    "Poor - Very unlikely to respond",
+    "Fair - Low but possible response",
+    "Good - Moderate chance of response",
+    "Excellent - High chance of response"
+)
+LIKELIHOOD_EMOJI_THRESHOLDS = (0.4, 0.7)
+LIKELIHOOD_EMOJIS = ("🔴", "🟡", "🟢")
+
+# Quick scores outside this band are decisive enough to skip the paid AI evaluation
+DECISIVE_LOW_LIKELIHOOD = 0.15
+DECISIVE_HIGH_LIKELIHOOD = 0.85  # The likelihood cap
+WORD_RE = re.compile(r"\S+")
+
+
+def _evaluation():
+    """Import src.evaluation, and with it the OpenAI SDK, on first use instead of at startup."""
+    from src import evaluation
+    return evaluation
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def get_journalist_entries(directory_mtime: int) -> List[Tuple[str, str, str]]:
+    """
+    List (journalist_id, name, publication) entries.
+    
+    Keyed on the journalists/ directory mtime, so added or removed files show
+    up at once; in-place edits don't change it and are picked up by the ttl.
+    """
+    return list_journalists_with_meta()
+
+
+def journalists_directory_mtime() -> int:
+    """Get the journalists/ directory mtime, which changes when persona files are added or removed."""
+    try:
+        return os.stat("journalists").st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def get_response_likelihood(pitch: str, journalist_id: str, persona_mtime: Optional[int],
+                            _journalist: Dict[str, Any]) -> float:
+    """
+    Score a pitch, memoized on (pitch, journalist_id, persona file mtime).
+    
+    The mtime is part of the key so an edited persona is rescored; the
+    persona itself is passed unhashed (leading underscore).
+    """
+    return _evaluation().calculate_response_likelihood(pitch, _journalist)
+
+
+def get_selected_journalist() -> Optional[Dict[str, Any]]:
+    """Get the sidebar-selected journalist, reusing the loaded persona until the selection or its file changes."""
+    journalist_id = st.session_state.get('selected_journalist')
+    if journalist_id is None:
+        return None
+    
+    try:
+        mtime = os.stat(f"journalists/{journalist_id}.json").st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    
+    current = st.session_state.get('current_journalist')
+    if current is None or current[:2] != (journalist_id, mtime):
+        current = (journalist_id, mtime, load_journalist(journalist_id))
+        st.session_state.current_journalist = current
+    return current[2]
+
 
 def main():
     st.set_page_config(
@@ -27,13 +120,15 @@ def main():
         
         # Journalist selector (always visible)
         st.header("Select Journalist")
-        journalists = list_journalists()
+        entries = get_journalist_entries(journalists_directory_mtime())
+        journalists = [journalist_id for journalist_id, _, _ in entries]
         
         if journalists:
+            labels = {journalist_id: f"{name} ({publication})" for journalist_id, name, publication in entries}
             selected_journalist_id = st.selectbox(
                 "Choose a journalist:",
                 journalists,
-                format_func=lambda x: load_journalist(x)["name"] + " (" + load_journalist(x)["publication"] + ")"
+                format_func=labels.__getitem__
             )
             
             # Store selected journalist in session state
@@ -41,6 +136,10 @@ def main():
         else:
             st.warning("No journalists found. Please create one first.")
             st.session_state.selected_journalist = None
+        
+        # Running AI cost for this session
+        if st.session_state.get('total_cost'):
+            st.metric("Session Cost", f"${st.session_state.total_cost:.4f}")
     
     # Check for OpenAI API key
     if not os.getenv("OPENAI_API_KEY"):
@@ -58,28 +157,28 @@ def main():
 def show_journalist_selection():
     st.header("Journalist Profile")
     
-    if not hasattr(st.session_state, 'selected_journalist') or st.session_state.selected_journalist is None:
+    journalist = get_selected_journalist()
+    if journalist is None:
         st.warning("Please select a journalist from the sidebar.")
         return
     
-    journalist = load_journalist(st.session_state.selected_journalist)
-    
     # Display journalist profile
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📰 Basic Info")
-        st.write(f"**Name:** {journalist['name']}")
-        st.write(f"**Publication:** {journalist['publication']}")
-        st.write(f"**Beat:** {journalist['beat']}")
-        st.write(f"**Base Response Rate:** {journalist['base_response_rate']:.1%}")
+        st.markdown(
+            f"**Name:** {journalist['name']}  \n"
+            f"**Publication:** {journalist['publication']}  \n"
+            f"**Beat:** {journalist['beat']}  \n"
+            f"**Base Response Rate:** {journalist['base_response_rate']:.1%}"
+        )
     
     with col2:
         st.subheader("🔍 Keywords")
         keywords = journalist.get('keyword_triggers', [])
         if keywords:
-            for keyword in keywords[:10]:  # Show first 10
-                st.code(keyword)
+            st.markdown(" ".join(f"`{keyword}`" for keyword in keywords[:10]))  # Show first 10
         else:
             st.write("No keywords defined")
     
@@ -87,10 +186,14 @@ def show_journalist_selection():
     st.subheader("📊 Response Factors")
     factors = journalist.get('response_factors', {})
     
+    # Render every category in a single markdown element
+    category_blocks = []
     for category, category_factors in factors.items():
-        st.write(f"**{category.title()}:**")
-        for factor, multiplier in category_factors.items():
-            st.write(f"  • {factor.replace('_', ' ').title()}: {multiplier}x")
+        lines = [f"**{category.title()}:**"]
+        lines.extend(f"- {factor.replace('_', ' ').title()}: {multiplier}x" for factor, multiplier in category_factors.items())
+        category_blocks.append("\n".join(lines))
+    if category_blocks:
+        st.markdown("\n\n".join(category_blocks))
     
     # System prompt preview
     with st.expander("🤖 System Prompt Preview"):
@@ -99,15 +202,21 @@ def show_journalist_selection():
 def show_pitch_evaluator():
     st.header("Pitch Evaluator")
     
-    if not hasattr(st.session_state, 'selected_journalist') or st.session_state.selected_journalist is None:
+    journalist = get_selected_journalist()
+    if journalist is None:
         st.warning("Please select a journalist from the sidebar first.")
         return
     
-    journalist = load_journalist(st.session_state.selected_journalist)
-    
     # Show selected journalist
     st.info(f"Evaluating pitch for **{journalist['name']}** at **{journalist['publication']}** ({journalist['beat']})")
     
+    show_pitch_evaluation_form(journalist)
+    show_batch_evaluator(journalist)
+
+
+@st.fragment
+def show_pitch_evaluation_form(journalist):
+    """Pitch input and results, rerun as a fragment so edits don't rerun the whole app."""
     # Pitch input
     pitch = st.text_area(
         "Enter your pitch:",
@@ -121,11 +230,24 @@ def show_pitch_evaluator():
         basic_eval = st.button("Quick Evaluation (Free)", type="secondary")
     with col2:
         ai_eval = st.button("AI Evaluation (Premium)", type="primary")
+    force_ai_eval = st.checkbox(
+        "Always run AI evaluation",
+        help="By default the AI evaluation is skipped when the quick score is already very low or at the cap."
+    )
     
     if basic_eval or ai_eval:
         if pitch.strip():
-            # Calculate response likelihood
-            likelihood = calculate_response_likelihood(pitch, journalist)
+            # Calculate response likelihood and run the quick analysis, reusing the
+            # last result when the same pitch is evaluated against the same persona file
+            journalist_id, persona_mtime, _ = st.session_state.current_journalist
+            eval_key = (hash(pitch), journalist_id, persona_mtime)
+            if st.session_state.get('last_eval_key') == eval_key:
+                likelihood, analysis = st.session_state.last_eval
+            else:
+                likelihood = get_response_likelihood(pitch, journalist_id, persona_mtime, journalist)
+                analysis = analyze_pitch(pitch, journalist, likelihood)
+                st.session_state.last_eval_key = eval_key
+                st.session_state.last_eval = (likelihood, analysis)
             
             # Display results
             col1, col2 = st.columns(2)
@@ -134,15 +256,7 @@ def show_pitch_evaluator():
                 st.subheader("📊 Response Likelihood")
                 
                 # Progress bar with color coding
-                if likelihood >= 0.7:
-                    color = "green"
-                    emoji = "🟢"
-                elif likelihood >= 0.4:
-                    color = "orange" 
-                    emoji = "🟡"
-                else:
-                    color = "red"
-                    emoji = "🔴"
+                emoji = LIKELIHOOD_EMOJIS[bisect_right(LIKELIHOOD_EMOJI_THRESHOLDS, likelihood)]
                 
                 st.metric(
                     label="Likelihood",
@@ -156,52 +270,50 @@ def show_pitch_evaluator():
             with col2:
                 st.subheader("💡 Quick Analysis")
                 
-                # Analyze pitch factors
-                factors_found = analyze_pitch_factors(pitch, journalist)
+                # Pitch factors
+                factors_found = analysis["factors"]
                 
                 if factors_found:
-                    st.write("**Positive factors detected:**")
-                    for factor in factors_found:
-                        st.write(f"✅ {factor}")
+                    st.markdown("**Positive factors detected:**\n\n" + "  \n".join(f"✅ {factor}" for factor in factors_found))
                 else:
                     st.write("No strong positive factors detected.")
                 
                 # Keyword matches
-                keywords = journalist.get('keyword_triggers', [])
-                matched_keywords = [kw for kw in keywords if kw.lower() in pitch.lower()]
+                matched_keywords = analysis["matched_keywords"]
                 
                 if matched_keywords:
-                    st.write("**Keyword matches:**")
-                    for keyword in matched_keywords:
-                        st.code(keyword)
+                    st.markdown("**Keyword matches:**\n\n" + " ".join(f"`{keyword}`" for keyword in matched_keywords))
             
             # Basic improvement suggestions
             with st.expander("🚀 Basic Improvement Suggestions"):
-                suggestions = get_improvement_suggestions(pitch, journalist, likelihood)
-                for suggestion in suggestions:
-                    st.write(f"• {suggestion}")
+                st.markdown("\n".join(f"- {suggestion}" for suggestion in analysis["suggestions"]))
             
             # AI evaluation (if requested)
             if ai_eval:
                 with st.expander("🤖 AI Expert Analysis", expanded=True):
-                    if os.getenv("OPENAI_API_KEY"):
-                        with st.spinner("Getting AI feedback..."):
-                            ai_feedback, cost = evaluate_pitch_with_ai(pitch, journalist)
+                    is_decisive = not DECISIVE_LOW_LIKELIHOOD < likelihood < DECISIVE_HIGH_LIKELIHOOD
+                    if is_decisive and not force_ai_eval:
+                        st.info("The quick score is already decisive, so the AI evaluation was skipped to save cost. "
+                                "Tick 'Always run AI evaluation' to run it anyway.")
+                    elif os.getenv("OPENAI_API_KEY"):
+                        # Render feedback as it streams in
+                        ai_result = {}
+                        st.write_stream(_evaluation().stream_pitch_evaluation(pitch, journalist, ai_result))
+                        if ai_result.get("error"):
+                            st.error(ai_result["error"])
+                        cost = ai_result["cost"]
+                        
+                        # Cost tracking
+                        if cost > 0:
+                            st.caption(f"💰 Estimated cost: ${cost:.4f}")
                             
-                            st.markdown(ai_feedback)
+                            # Update session state cost tracking
+                            if 'total_cost' not in st.session_state:
+                                st.session_state.total_cost = 0
+                            st.session_state.total_cost += cost
                             
-                            # Cost tracking
-                            if cost > 0:
-                                st.caption(f"💰 Estimated cost: ${cost:.4f}")
-                                
-                                # Update session state cost tracking
-                                if 'total_cost' not in st.session_state:
-                                    st.session_state.total_cost = 0
-                                st.session_state.total_cost += cost
-                                
-                                # Show running total in sidebar
-                                with st.sidebar:
-                                    st.metric("Session Cost", f"${st.session_state.total_cost:.4f}")
+                            # Fragments can't write to the sidebar, so show the running total here
+                            st.caption(f"Session cost so far: ${st.session_state.total_cost:.4f}")
                     else:
                         st.error("OpenAI API key required for AI evaluation. Please set OPENAI_API_KEY in your .env file.")
         
@@ -209,69 +321,123 @@ def show_pitch_evaluator():
             st.error("Please enter a pitch to evaluate.")
 
 
+def show_batch_evaluator(journalist):
+    """Submit many pitches at once through the Batch API and check on earlier jobs."""
+    if 'batch_jobs' not in st.session_state:
+        st.session_state.batch_jobs = []
+    
+    with st.expander("📦 Batch Evaluation (50% cheaper, results within 24h)"):
+        batch_text = st.text_area("One pitch per line:", key="batch_pitches", height=150)
+        if st.button("Batch Evaluate"):
+            pitches = [line.strip() for line in batch_text.splitlines() if line.strip()]
+            if pitches:
+                try:
+                    batch_id, cache_keys = _evaluation().submit_batch_evaluation(pitches, journalist)
+                    st.session_state.batch_jobs.append({
+                        "batch_id": batch_id,
+                        "cache_keys": cache_keys,
+                        "pitches": pitches,
+                        "likelihoods": _evaluation().calculate_response_likelihood_batch(pitches, [journalist])[:, 0].tolist(),
+                        "results": []
+                    })
+                    st.success(f"Submitted {len(pitches)} pitches (batch {batch_id})")
+                except Exception as e:
+                    st.error(f"Error submitting batch: {str(e)}")
+            else:
+                st.error("Please enter at least one pitch.")
+        
+        for job in st.session_state.batch_jobs:
+            st.write(f"**Batch {job['batch_id']}** ({len(job['pitches'])} pitches)")
+            if job.get("failed_status"):
+                st.error(f"Batch {job['failed_status']}, no results available")
+            elif not job["results"] and st.button("Check status", key=f"check_{job['batch_id']}"):
+                try:
+                    status, results = _evaluation().get_batch_evaluation_results(job["batch_id"], job["cache_keys"])
+                    if results:
+                        job["results"] = results
+                        st.session_state.total_cost = st.session_state.get('total_cost', 0) + sum(cost for _, cost in results)
+                    elif status in _evaluation().BATCH_FAILED_STATUSES:
+                        job["failed_status"] = status
+                        st.error(f"Batch {status}, no results available")
+                    else:
+                        st.info(f"Batch status: {status}")
+                except Exception as e:
+                    st.error(f"Error checking batch: {str(e)}")
+            
+            for pitch, likelihood, (feedback, cost) in zip(job["pitches"], job["likelihoods"], job["results"]):
+                st.markdown(f"**Pitch:** {pitch} ({likelihood:.1%} response likelihood)")
+                st.markdown(feedback)
+                st.caption(f"💰 Estimated cost: ${cost:.4f}")
+
+
 def get_likelihood_assessment(likelihood):
     """Get human-readable assessment of likelihood."""
-    if likelihood >= 0.7:
-        return "Excellent - High chance of response"
-    elif likelihood >= 0.5:
-        return "Good - Moderate chance of response"
-    elif likelihood >= 0.3:
-        return "Fair - Low but possible response"
-    else:
-        return "Poor - Very unlikely to respond"
-
-
-def analyze_pitch_factors(pitch, journalist):
-    """Analyze which positive factors are present in the pitch."""
-    factors = []
+    return ASSESSMENT_LABELS[bisect_right(ASSESSMENT_THRESHOLDS, likelihood)]
+
+
+def analyze_pitch(pitch, journalist, likelihood):
+    """Run the quick analysis with one Aho-Corasick pass over factor terms and keywords."""
     pitch_lower = pitch.lower()
+    keywords = journalist.get('keyword_triggers', [])
+    term_groups = PITCH_FACTOR_TERMS + tuple((KEYWORD_GROUP_PREFIX + kw, (kw,)) for kw in keywords)
+    hits = _evaluation().find_term_groups(pitch_lower, term_groups)
+    matched_keywords = [kw for kw in keywords if KEYWORD_GROUP_PREFIX + kw in hits]
+    
+    return {
+        "factors": analyze_pitch_factors(hits),
+        "matched_keywords": matched_keywords,
+        "suggestions": get_improvement_suggestions(pitch, pitch_lower, journalist, likelihood, hits, matched_keywords)
+    }
+
+
+def analyze_pitch_factors(hits):
+    """Map the term groups found in a pitch to the positive factors they indicate."""
+    factors = []
     
     # Check timing factors
-    if "exclusive" in pitch_lower:
+    if "exclusive" in hits:
         factors.append("Exclusive story")
-    if "breaking" in pitch_lower:
+    if "breaking" in hits:
         factors.append("Breaking news angle")
-    if "embargo" in pitch_lower:
+    if "embargo" in hits:
         factors.append("Embargoed information")
     
     # Check quality factors
-    if any(word in pitch_lower for word in ["data", "study", "research", "survey"]):
+    if "data" in hits:
         factors.append("Data-driven content")
-    if any(word in pitch_lower for word in ["ceo", "founder", "executive"]):
+    if "executive" in hits:
         factors.append("Executive access")
     
     # Check relevance to beat
-    beat_terms = ["enterprise", "software", "saas", "b2b", "security", "technology", "startup"]
-    if any(term in pitch_lower for term in beat_terms):
+    if "beat" in hits:
         factors.append("On-beat relevance")
     
     return factors
 
 
-def get_improvement_suggestions(pitch, journalist, likelihood):
+def get_improvement_suggestions(pitch, pitch_lower, journalist, likelihood, hits, matched_keywords):
     """Generate improvement suggestions based on pitch analysis."""
     suggestions = []
-    pitch_lower = pitch.lower()
     
     if likelihood < 0.3:
         suggestions.append("Consider if this story is relevant to the journalist's beat")
         suggestions.append("Add more compelling news value (exclusivity, timing, impact)")
     
-    if "exclusive" not in pitch_lower and likelihood < 0.6:
+    if "exclusive" not in hits and likelihood < 0.6:
         suggestions.append("Consider offering exclusive access or first look")
     
-    if not any(word in pitch_lower for word in ["data", "study", "research"]):
+    if "research" not in hits:
         suggestions.append("Include data or research to support your story")
     
     if journalist['name'].lower() not in pitch_lower and 'name' not in pitch_lower:
         suggestions.append("Personalize the pitch with the journalist's name")
     
-    keywords = journalist.get('keyword_triggers', [])
-    matched_keywords = [kw for kw in keywords if kw.lower() in pitch_lower]
     if not matched_keywords:
+        keywords = journalist.get('keyword_triggers', [])
         suggestions.append(f"Consider including relevant keywords: {', '.join(keywords[:3])}")
     
-    if len(pitch.split()) > 150:
+    # Count words without building a token list
+    if sum(1 for _ in WORD_RE.finditer(pitch)) > 150:
         suggestions.append("Consider shortening your pitch - journalists prefer concise messages")
     
     return suggestions
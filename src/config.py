@@ -1,4 +1,5 @@
 """Configuration for AI models and costs."""
+from dataclasses import dataclass
 
 # Model configuration based on use case
 MODEL_CONFIG = {
@@ -10,26 +11,57 @@ MODEL_CONFIG = {
 # Approximate cost per 1K tokens (update as needed)
 MODEL_COSTS = {
     "o3-mini-2025-01-31": {
-        "input": 0.000125,   # $0.000125 per 1K input tokens
-        "output": 0.0005     # $0.0005 per 1K output tokens  
+        "input": 0.000125,         # $0.000125 per 1K input tokens
+        "cached_input": 0.0000625, # Prompt-cache hits bill at half the input rate
+        "output": 0.0005           # $0.0005 per 1K output tokens  
     },
     "o3-2025-04-16": {
-        "input": 0.015,      # $0.015 per 1K input tokens
-        "output": 0.06       # $0.06 per 1K output tokens
+        "input": 0.015,            # $0.015 per 1K input tokens
+        "cached_input": 0.00375,   # Prompt-cache hits bill at a quarter of the input rate
+        "output": 0.06             # $0.06 per 1K output tokens
     }
 }
 
+# Batch API requests are billed at half the synchronous rate
+BATCH_DISCOUNT = 0.5
+
+
+@dataclass(frozen=True)
+class TokenRates:
+    """Per-token prices for one model, precomputed from MODEL_COSTS."""
+    __slots__ = ("input", "cached_input", "output")
+    
+    input: float
+    cached_input: float
+    output: float
+
+
+_TOKEN_RATES = {
+    model: TokenRates(
+        input=costs["input"] / 1000,
+        cached_input=costs.get("cached_input", costs["input"]) / 1000,
+        output=costs["output"] / 1000
+    )
+    for model, costs in MODEL_COSTS.items()
+}
+
 def get_model_for_task(task: str) -> str:
     """Get the appropriate model for a given task."""
     return MODEL_CONFIG.get(task, MODEL_CONFIG["evaluation"])
 
-def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-    """Estimate cost for a model call."""
-    if model not in MODEL_COSTS:
-        return 0.0
+def estimate_cost(model: str, input_tokens: int, output_tokens: int, cached_input_tokens: int = 0) -> float:
+    """
+    Estimate cost for a model call.
     
-    costs = MODEL_COSTS[model]
-    input_cost = (input_tokens / 1000) * costs["input"]
-    output_cost = (output_tokens / 1000) * costs["output"]
+    `cached_input_tokens` is the part of `input_tokens` served from the
+    provider's prompt cache, billed at the discounted `cached_input` rate.
+    """
+    rates = _TOKEN_RATES.get(model)
+    if rates is None:
+        return 0.0
     
-    return input_cost + output_cost
\ No newline at end of file
+    return (
+        (input_tokens - cached_input_tokens) * rates.input
+        + cached_input_tokens * rates.cached_input
+        + output_tokens * rates.output
+    )
\ No newline at end of file
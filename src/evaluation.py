@@ -1,13 +1,43 @@
 import re
 import os
-from typing import Dict, Any, Tuple
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Set, Tuple
+if TYPE_CHECKING:
+    import numpy as np
+# The OpenAI SDK is slow to import and only needed for API calls, so just its
+# version is checked here; the package itself is imported on first use
+OPENAI_V1 = int(version("openai").split(".")[0]) >= 1
 try:
-    from openai import OpenAI  # v1.0+
-    OPENAI_V1 = True
+    import ahocorasick  # type: ignore[import-not-found]  # optional: single-pass multi-keyword matching
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    import openai  # v0.x
-    OPENAI_V1 = False
-from .config import get_model_for_task, estimate_cost
+    AHOCORASICK_AVAILABLE = False
+from .config import get_model_for_task, estimate_cost, BATCH_DISCOUNT
+
+# On-disk cache of AI feedback, keyed by a hash of the model and full prompt
+AI_CACHE_DIR = Path(".ai_cache")
+
+# Batch statuses that will never produce results
+BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+
+
+# Pitch signal patterns, compiled once at import time
+# Timing cues map to the timing factor they trigger, in the order they are applied
+TIMING_FACTOR_ORDER = ("exclusive", "breaking_news", "embargo", "follow_up")
+TIMING_RE = re.compile(r"(?P<exclusive>exclusive)|(?P<breaking_news>breaking)|(?P<embargo>embargo)|(?P<follow_up>follow)")
+# Beat terms use word boundaries to avoid partial matches like "tech" in "unrelated to tech"
+BEAT_RE = re.compile(
+    r"\b(?:enterprise|software|saas|b2b|security|data|technology|startup|funding|acquisition)\b"
+)
+ADJACENT_BEAT_RE = re.compile(r"business|corporate|digital|innovation")
+DATA_DRIVEN_RE = re.compile(r"data|study|research|survey|report|analysis|statistics")
+EXECUTIVE_ACCESS_RE = re.compile(r"ceo|cto|founder|executive|interview|exclusive access")
+GENERIC_PITCH_RE = re.compile(r"product launch|pleased to announce|exciting news|revolutionary")
 
 
 def calculate_response_likelihood(pitch: str, journalist_data: Dict[str, Any]) -> float:
@@ -22,61 +52,56 @@ def calculate_response_likelihood(pitch: str, journalist_data: Dict[str, Any]) -
         Float between 0 and 1 representing response likelihood (capped at 0.85)
     """
     likelihood = journalist_data.get("base_response_rate", 0.1)
+    pitch_lower = pitch.lower()
     
     # Get response factors, default to empty dict if not present
     response_factors = journalist_data.get("response_factors", {})
     
     # Apply timing factors
     timing_factors = response_factors.get("timing", {})
-    likelihood = _apply_timing_factors(pitch, likelihood, timing_factors)
+    likelihood = _apply_timing_factors(pitch_lower, likelihood, timing_factors)
     
     # Apply relevance factors
     relevance_factors = response_factors.get("relevance", {})
-    likelihood = _apply_relevance_factors(pitch, likelihood, relevance_factors)
+    likelihood = _apply_relevance_factors(pitch_lower, likelihood, relevance_factors)
     
     # Apply quality factors
     quality_factors = response_factors.get("quality", {})
-    likelihood = _apply_quality_factors(pitch, likelihood, quality_factors)
+    likelihood = _apply_quality_factors(pitch_lower, likelihood, quality_factors)
     
-    # Apply keyword triggers
-    keyword_triggers = journalist_data.get("keyword_triggers", [])
-    likelihood = _apply_keyword_boost(pitch, likelihood, keyword_triggers)
+    # Keyword boosts only ever raise the likelihood, so past the cap they can be skipped
+    if likelihood >= 0.85:
+        return 0.85
+    
+    # Apply keyword triggers (lowercased at save time when available)
+    keyword_triggers = journalist_data.get("keyword_triggers_lower")
+    if keyword_triggers is None:
+        keyword_triggers = [keyword.lower() for keyword in journalist_data.get("keyword_triggers", [])]
+    likelihood = _apply_keyword_boost(pitch_lower, likelihood, keyword_triggers)
     
     # Cap at realistic maximum (85%)
     return min(likelihood, 0.85)
 
 
-def _apply_timing_factors(pitch: str, likelihood: float, timing_factors: Dict[str, float]) -> float:
+def _apply_timing_factors(pitch_lower: str, likelihood: float, timing_factors: Dict[str, float]) -> float:
     """Apply timing-based multipliers to likelihood."""
-    pitch_lower = pitch.lower()
-    
-    if "exclusive" in pitch_lower and "exclusive" in timing_factors:
-        likelihood *= timing_factors["exclusive"]
-    
-    if "breaking" in pitch_lower and "breaking_news" in timing_factors:
-        likelihood *= timing_factors["breaking_news"]
+    if not timing_factors:
+        return likelihood
     
-    if "embargo" in pitch_lower and "embargo" in timing_factors:
-        likelihood *= timing_factors["embargo"]
+    # One scan collects every timing cue present in the pitch
+    found = {match.lastgroup for match in TIMING_RE.finditer(pitch_lower)}
     
-    if "follow" in pitch_lower and "follow_up" in timing_factors:
-        likelihood *= timing_factors["follow_up"]
+    for factor in TIMING_FACTOR_ORDER:
+        if factor in found and factor in timing_factors:
+            likelihood *= timing_factors[factor]
     
     return likelihood
 
 
-def _apply_relevance_factors(pitch: str, likelihood: float, relevance_factors: Dict[str, float]) -> float:
+def _apply_relevance_factors(pitch_lower: str, likelihood: float, relevance_factors: Dict[str, float]) -> float:
     """Apply relevance-based multipliers to likelihood."""
-    pitch_lower = pitch.lower()
-    
     # Check for beat-relevant terms (this is simplified - could be more sophisticated)
-    beat_terms = [
-        "enterprise", "software", "saas", "b2b", "security", "data", 
-        "technology", "startup", "funding", "acquisition"
-    ]
-    
-    # Use word boundaries to avoid partial matches like "tech" in "unrelated to tech"
-    has_beat_match = any(re.search(r'\b' + re.escape(term) + r'\b', pitch_lower) for term in beat_terms)
+    has_beat_match = BEAT_RE.search(pitch_lower) is not None
     
     if has_beat_match and "exact_beat" in relevance_factors:
         likelihood *= relevance_factors["exact_beat"]
@@ -84,46 +109,170 @@ def _apply_relevance_factors(pitch: str, likelihood: float, relevance_factors: D
         likelihood *= relevance_factors["off_beat"]
     
     # Check for adjacent beat (partial match)
-    adjacent_terms = ["business", "corporate", "digital", "innovation"]
-    has_adjacent_match = any(term in pitch_lower for term in adjacent_terms)
-    
-    if has_adjacent_match and not has_beat_match and "adjacent_beat" in relevance_factors:
+    if not has_beat_match and "adjacent_beat" in relevance_factors and ADJACENT_BEAT_RE.search(pitch_lower):
         likelihood *= relevance_factors["adjacent_beat"]
     
     return likelihood
 
 
-def _apply_quality_factors(pitch: str, likelihood: float, quality_factors: Dict[str, float]) -> float:
+def _apply_quality_factors(pitch_lower: str, likelihood: float, quality_factors: Dict[str, float]) -> float:
     """Apply quality-based multipliers to likelihood."""
-    pitch_lower = pitch.lower()
-    
     # Data-driven indicators
-    data_indicators = ["data", "study", "research", "survey", "report", "analysis", "statistics"]
-    if any(indicator in pitch_lower for indicator in data_indicators) and "data_driven" in quality_factors:
+    if "data_driven" in quality_factors and DATA_DRIVEN_RE.search(pitch_lower):
         likelihood *= quality_factors["data_driven"]
     
     # Executive access indicators
-    exec_indicators = ["ceo", "cto", "founder", "executive", "interview", "exclusive access"]
-    if any(indicator in pitch_lower for indicator in exec_indicators) and "executive_access" in quality_factors:
+    if "executive_access" in quality_factors and EXECUTIVE_ACCESS_RE.search(pitch_lower):
         likelihood *= quality_factors["executive_access"]
     
     # Generic pitch penalties
-    generic_indicators = ["product launch", "pleased to announce", "exciting news", "revolutionary"]
-    if any(indicator in pitch_lower for indicator in generic_indicators) and "generic_pitch" in quality_factors:
+    if "generic_pitch" in quality_factors and GENERIC_PITCH_RE.search(pitch_lower):
         likelihood *= quality_factors["generic_pitch"]
     
     return likelihood
 
 
-def _apply_keyword_boost(pitch: str, likelihood: float, keyword_triggers: list) -> float:
-    """Apply keyword-based boosts to likelihood."""
+def calculate_response_likelihood_batch(pitches: List[str], journalists: List[Dict[str, Any]]) -> "np.ndarray":
+    """
+    Calculate response likelihoods for every (pitch, journalist) pair at once.
+    
+    Each pitch is scanned once for its signals; the per-journalist multipliers
+    are then applied as whole-array operations, in the same order as
+    `calculate_response_likelihood`, so the results match it exactly.
+    
+    Args:
+        pitches: The pitch texts to evaluate
+        journalists: Journalist persona data with response factors
+        
+    Returns:
+        Array of shape (len(pitches), len(journalists)), capped at 0.85
+    """
+    # Imported here so single-pitch scoring doesn't pay for loading NumPy
+    import numpy as np
+    
+    pitches_lower = [pitch.lower() for pitch in pitches]
+    
+    # Pitch signals, shape (P,)
+    timing_found = [{match.lastgroup for match in TIMING_RE.finditer(pitch)} for pitch in pitches_lower]
+    has_beat = np.array([BEAT_RE.search(pitch) is not None for pitch in pitches_lower], dtype=bool)
+    has_adjacent = np.array([ADJACENT_BEAT_RE.search(pitch) is not None for pitch in pitches_lower], dtype=bool)
+    quality_signals = {
+        "data_driven": DATA_DRIVEN_RE,
+        "executive_access": EXECUTIVE_ACCESS_RE,
+        "generic_pitch": GENERIC_PITCH_RE,
+    }
+    quality_found = {
+        factor: np.array([pattern.search(pitch) is not None for pitch in pitches_lower], dtype=bool)
+        for factor, pattern in quality_signals.items()
+    }
+    
+    # Journalist multipliers, shape (J,); a missing factor multiplies by 1
+    factors = [journalist.get("response_factors", {}) for journalist in journalists]
+    
+    def multipliers(category: str, factor: str) -> np.ndarray:
+        return np.array([f.get(category, {}).get(factor, 1.0) for f in factors], dtype=float)
+    
+    likelihood = np.tile(
+        np.array([journalist.get("base_response_rate", 0.1) for journalist in journalists], dtype=float),
+        (len(pitches), 1)
+    )
+    
+    for factor in TIMING_FACTOR_ORDER:
+        found = np.array([factor in found_factors for found_factors in timing_found], dtype=bool)
+        likelihood *= np.where(found[:, None], multipliers("timing", factor), 1.0)
+    
+    likelihood *= np.where(
+        has_beat[:, None], multipliers("relevance", "exact_beat"), multipliers("relevance", "off_beat")
+    )
+    likelihood *= np.where((~has_beat & has_adjacent)[:, None], multipliers("relevance", "adjacent_beat"), 1.0)
+    
+    for factor in quality_signals:
+        likelihood *= np.where(quality_found[factor][:, None], multipliers("quality", factor), 1.0)
+    
+    # Keyword hit counts via one pass per pitch over the union of all triggers
+    keyword_lists = [
+        journalist["keyword_triggers_lower"] if journalist.get("keyword_triggers_lower") is not None
+        else [keyword.lower() for keyword in journalist.get("keyword_triggers", [])]
+        for journalist in journalists
+    ]
+    vocabulary = sorted({keyword for keywords in keyword_lists for keyword in keywords})
+    if vocabulary:
+        index = {keyword: i for i, keyword in enumerate(vocabulary)}
+        incidence = np.zeros((len(journalists), len(vocabulary)))
+        for j, keywords in enumerate(keyword_lists):
+            for keyword in keywords:
+                incidence[j, index[keyword]] += 1
+        
+        hits = np.zeros((len(pitches), len(vocabulary)))
+        for p, pitch in enumerate(pitches_lower):
+            for keyword in find_keyword_matches(pitch, vocabulary):
+                hits[p, index[keyword]] = 1
+        
+        counts = hits @ incidence.T
+        likelihood *= 1 + (counts * 0.2) / (1 + counts * 0.1)
+    
+    return np.minimum(likelihood, 0.85)
+
+
+@lru_cache(maxsize=128)
+def _build_term_automaton(term_groups: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Any:
+    """Build an Aho-Corasick automaton mapping each lowercased term to its groups (cached per term set)."""
+    groups_by_term: Dict[str, List[str]] = {}
+    for group, terms in term_groups:
+        for term in terms:
+            groups_by_term.setdefault(term.lower(), []).append(group)
+    
+    automaton = ahocorasick.Automaton()
+    for term, groups in groups_by_term.items():
+        automaton.add_word(term, tuple(groups))
+    automaton.make_automaton()
+    return automaton
+
+
+def find_term_groups(pitch_lower: str, term_groups: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Set[str]:
+    """
+    Find which groups of terms appear in a pitch, in a single pass.
+    
+    Args:
+        pitch_lower: The pitch text, already lowercased
+        term_groups: (group_name, terms) pairs, as tuples so the automaton can be cached
+        
+    Returns:
+        Names of the groups with at least one term present in the pitch
+    """
+    if not any(terms for _, terms in term_groups):
+        return set()
+    
+    if not AHOCORASICK_AVAILABLE:
+        return {group for group, terms in term_groups if any(term.lower() in pitch_lower for term in terms)}
+    
+    # One pass over the pitch finds every term, including overlapping ones
+    automaton = _build_term_automaton(term_groups)
+    return {group for _, groups in automaton.iter(pitch_lower) for group in groups}
+
+
+def find_keyword_matches(pitch_lower: str, keywords: List[str]) -> List[str]:
+    """
+    Find which keywords appear in a pitch.
+    
+    Args:
+        pitch_lower: The pitch text, already lowercased
+        keywords: Journalist keyword triggers (any case)
+        
+    Returns:
+        Matched keywords in their original order and casing
+    """
+    found = find_term_groups(pitch_lower, tuple((keyword, (keyword,)) for keyword in keywords))
+    return [kw for kw in keywords if kw in found]
+
+
+def _apply_keyword_boost(pitch_lower: str, likelihood: float, keyword_triggers: list) -> float:
+    """Apply keyword-based boosts to likelihood. Expects lowercased keyword triggers."""
     if not keyword_triggers:
         return likelihood
     
-    pitch_lower = pitch.lower()
-    
-    # Count keyword matches
-    keyword_matches = sum(1 for keyword in keyword_triggers if keyword.lower() in pitch_lower)
+    # Count keyword matches in a single automaton pass
+    keyword_matches = len(find_keyword_matches(pitch_lower, keyword_triggers))
     
     # Apply boost based on keyword matches (diminishing returns)
     if keyword_matches > 0:
@@ -134,17 +283,66 @@ def _apply_keyword_boost(pitch: str, likelihood: float, keyword_triggers: list)
     return likelihood
 
 
-def evaluate_pitch_with_ai(pitch: str, journalist_data: Dict[str, Any]) -> Tuple[str, float]:
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: Optional[str]) -> Any:
+    """Create one OpenAI client per API key and reuse it, keeping HTTP connections alive."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Collapse spaces and tabs within each line and trim its ends, keeping line breaks."""
+    return "\n".join(" ".join(line.split()) for line in text.strip().splitlines())
+
+
+def _feedback_cache_key(model: str, messages: List[Dict[str, str]]) -> str:
     """
-    Evaluate a pitch using AI and return detailed feedback with cost tracking.
+    Get the cache key for a (model, messages) pair.
     
-    Returns:
-        Tuple of (feedback_text, estimated_cost)
+    Runs of spaces and tabs, and whitespace at the ends of lines, are
+    normalized before hashing, so a pitch that only differs in spacing
+    reuses the cached feedback. Line breaks are kept, since paragraph
+    structure is graded.
     """
-    model = get_model_for_task("evaluation")
+    prompt = "\n".join(_normalize_whitespace(message["content"]) for message in messages)
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def _feedback_cache_path(model: str, messages: List[Dict[str, str]]) -> Path:
+    """Get the cache file for a (model, messages) pair."""
+    return AI_CACHE_DIR / f"{_feedback_cache_key(model, messages)}.json"
+
+
+def _load_cached_feedback(cache_path: Path) -> Optional[str]:
+    """Return cached feedback, or None on a miss, empty or unreadable entry."""
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)["feedback"] or None
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _save_cached_feedback(cache_path: Path, feedback: str) -> None:
+    """Store feedback in the on-disk cache (best effort); empty feedback is never cached."""
+    if not feedback:
+        return
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({"feedback": feedback}, f)
+    except OSError:
+        pass
+
+
+def _build_evaluation_system_prompt(journalist_data: Dict[str, Any]) -> str:
+    """
+    Build the per-journalist part of the evaluation prompt.
     
-    # Build evaluation prompt
-    prompt = f"""You are an expert PR consultant evaluating a pitch to {journalist_data['name']} at {journalist_data['publication']}.
+    This text only depends on the journalist, so sending it first as the system
+    message gives every pitch to the same journalist an identical prompt prefix,
+    which OpenAI's automatic prompt caching bills at a discount.
+    """
+    return f"""You are an expert PR consultant with deep knowledge of journalism and media relations, evaluating pitches to {journalist_data['name']} at {journalist_data['publication']}.
 
 JOURNALIST PROFILE:
 - Beat: {journalist_data['beat']}
@@ -152,10 +350,7 @@ JOURNALIST PROFILE:
 - Keywords: {', '.join(journalist_data.get('keyword_triggers', []))}
 - Personality: {journalist_data.get('system_prompt', 'Professional journalist')}
 
-PITCH TO EVALUATE:
-{pitch}
-
-Please provide a detailed evaluation covering:
+For each pitch, provide a detailed evaluation covering:
 1. **Relevance** - How well does this match the journalist's beat and interests?
 2. **News Value** - What makes this newsworthy? Is there a compelling angle?
 3. **Timing** - Are there any timing considerations (exclusivity, breaking news, etc.)?
@@ -164,42 +359,249 @@ Please provide a detailed evaluation covering:
 
 Provide specific, actionable feedback that helps improve the pitch. Be direct but constructive."""
 
+
+def _build_evaluation_messages(pitch: str, journalist_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Build the chat messages for evaluating one pitch: stable journalist prefix first, pitch last."""
+    return [
+        {"role": "system", "content": _build_evaluation_system_prompt(journalist_data)},
+        {"role": "user", "content": f"PITCH TO EVALUATE:\n{pitch}"}
+    ]
+
+
+def _prompt_cache_key(messages: List[Dict[str, str]]) -> str:
+    """Key that routes evaluations sharing a journalist prefix to the same OpenAI prompt cache."""
+    return "pitch-eval-" + hashlib.sha256(messages[0]["content"].encode("utf-8")).hexdigest()[:16]
+
+
+def _estimate_input_tokens(messages: List[Dict[str, str]]) -> int:
+    """Roughly estimate prompt tokens from word count."""
+    return int(sum(len(message["content"].split()) for message in messages) * 1.3)
+
+
+def _estimate_call_cost(model: str, messages: List[Dict[str, str]], feedback: str, usage: Any = None) -> float:
+    """
+    Estimate the cost of one evaluation call.
+    
+    Uses the token counts reported by the API when available, including prompt
+    tokens served from OpenAI's prompt cache, and word-count estimates otherwise.
+    """
+    input_tokens = getattr(usage, "prompt_tokens", None) or _estimate_input_tokens(messages)
+    output_tokens = getattr(usage, "completion_tokens", None) or int(len(feedback.split()) * 1.3)
+    cached_tokens = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None) or 0
+    return estimate_cost(model, input_tokens, output_tokens, cached_tokens)
+
+
+def evaluate_pitch_with_ai(pitch: str, journalist_data: Dict[str, Any]) -> Tuple[str, float]:
+    """
+    Evaluate a pitch using AI and return detailed feedback with cost tracking.
+    
+    Identical pitches for the same journalist and model are served from the
+    on-disk cache at no cost.
+    
+    Returns:
+        Tuple of (feedback_text, estimated_cost)
+    """
+    model = get_model_for_task("evaluation")
+    
+    messages = _build_evaluation_messages(pitch, journalist_data)
+
+    cache_path = _feedback_cache_path(model, messages)
+    cached_feedback = _load_cached_feedback(cache_path)
+    if cached_feedback is not None:
+        return cached_feedback, 0.0
+
     try:
         if OPENAI_V1:
             # OpenAI v1.0+ API
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            client = _get_openai_client(os.getenv("OPENAI_API_KEY"))
             response = client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are an expert PR consultant with deep knowledge of journalism and media relations."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 max_tokens=1000,
-                temperature=0.7
+                temperature=0.7,
+                extra_body={"prompt_cache_key": _prompt_cache_key(messages)}
             )
             feedback = response.choices[0].message.content
-            output_tokens = response.usage.completion_tokens if response.usage else len(feedback.split()) * 1.3
         else:
             # OpenAI v0.x API
+            import openai
             openai.api_key = os.getenv("OPENAI_API_KEY")
             response = openai.ChatCompletion.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": "You are an expert PR consultant with deep knowledge of journalism and media relations."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 max_tokens=1000,
                 temperature=0.7
             )
             feedback = response.choices[0].message.content
-            output_tokens = response.usage.completion_tokens if hasattr(response, 'usage') else len(feedback.split()) * 1.3
         
         # Estimate cost
-        input_tokens = len(prompt.split()) * 1.3  # Rough estimate
-        cost = estimate_cost(model, int(input_tokens), int(output_tokens))
+        cost = _estimate_call_cost(model, messages, feedback, getattr(response, 'usage', None))
         
+        _save_cached_feedback(cache_path, feedback)
         return feedback, cost
         
     except Exception as e:
         error_msg = f"Error generating AI feedback: {str(e)}"
-        return error_msg, 0.0
\ No newline at end of file
+        return error_msg, 0.0
+
+
+def evaluate_pitches_concurrently(pairs: List[Tuple[str, Dict[str, Any]]],
+                                  max_workers: int = 8) -> List[Tuple[str, float]]:
+    """
+    Evaluate several (pitch, journalist_data) pairs with AI at the same time.
+    
+    The API calls are I/O bound, so running them on a thread pool over the
+    shared client brings wall time from the sum of the calls towards the
+    slowest one. Use submit_batch_evaluation instead when results can wait.
+    
+    Returns:
+        A (feedback_text, estimated_cost) tuple per pair, in input order
+    """
+    if not pairs:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        return list(executor.map(lambda pair: evaluate_pitch_with_ai(*pair), pairs))
+
+
+def stream_pitch_evaluation(pitch: str, journalist_data: Dict[str, Any],
+                            result: Dict[str, Any]) -> Iterator[str]:
+    """
+    Stream AI feedback for a pitch chunk by chunk, for incremental rendering.
+    
+    Once the stream is exhausted, result["feedback"] and result["cost"] hold the
+    values evaluate_pitch_with_ai would have returned. If the API call fails,
+    the error is not streamed: result["feedback"] keeps whatever text was
+    already yielded and result["error"] holds the error message.
+    """
+    model = get_model_for_task("evaluation")
+    messages = _build_evaluation_messages(pitch, journalist_data)
+    
+    cache_path = _feedback_cache_path(model, messages)
+    cached_feedback = _load_cached_feedback(cache_path)
+    if cached_feedback is not None or not OPENAI_V1:
+        # Nothing to stream: cache hit, or the v0.x API path
+        feedback, cost = (cached_feedback, 0.0) if cached_feedback is not None else evaluate_pitch_with_ai(pitch, journalist_data)
+        result.update(feedback=feedback, cost=cost)
+        yield feedback
+        return
+    
+    chunks = []
+    usage = None
+    try:
+        client = _get_openai_client(os.getenv("OPENAI_API_KEY"))
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=1000,
+            temperature=0.7,
+            extra_body={"prompt_cache_key": _prompt_cache_key(messages)},
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                chunks.append(chunk.choices[0].delta.content)
+                yield chunks[-1]
+    except Exception as e:
+        # Partial feedback was still generated (and billed), but isn't cached
+        feedback = "".join(chunks)
+        cost = _estimate_call_cost(model, messages, feedback, usage) if feedback else 0.0
+        result.update(feedback=feedback, cost=cost, error=f"Error generating AI feedback: {str(e)}")
+        return
+    
+    feedback = "".join(chunks)
+    result.update(feedback=feedback, cost=_estimate_call_cost(model, messages, feedback, usage))
+    _save_cached_feedback(cache_path, feedback)
+
+
+def submit_batch_evaluation(pitches: List[str], journalist_data: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """
+    Submit several pitches for AI evaluation through the OpenAI Batch API.
+    
+    Batch requests cost less but finish asynchronously (within 24 hours), so
+    this is for bulk evaluation rather than the interactive path.
+    
+    Returns:
+        Tuple of (batch_id, cache_keys) to pass to get_batch_evaluation_results.
+        The cache keys identify the prompts actually sent, one per pitch.
+    """
+    if not OPENAI_V1:
+        raise RuntimeError("Batch evaluation requires openai>=1.0")
+    
+    model = get_model_for_task("evaluation")
+    all_messages = [_build_evaluation_messages(pitch, journalist_data) for pitch in pitches]
+    batch_lines = [
+        json.dumps({
+            "custom_id": f"pitch-{index}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": messages,
+                "max_tokens": 1000,
+                "temperature": 0.7,
+                "prompt_cache_key": _prompt_cache_key(messages)
+            }
+        })
+        for index, messages in enumerate(all_messages)
+    ]
+    
+    client = _get_openai_client(os.getenv("OPENAI_API_KEY"))
+    batch_file = client.files.create(
+        file=("pitch_evaluations.jsonl", "\n".join(batch_lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    return batch.id, [_feedback_cache_key(model, messages) for messages in all_messages]
+
+
+def get_batch_evaluation_results(batch_id: str, cache_keys: List[str]) -> Tuple[str, List[Tuple[str, float]]]:
+    """
+    Check a batch submitted with submit_batch_evaluation and collect its feedback.
+    
+    Completed feedback is also written to the on-disk cache under the keys of
+    the prompts that were submitted, so evaluating the same pitch again
+    interactively is free, and a persona edited since submission can't pick
+    up feedback for a prompt it never sent.
+    
+    Returns:
+        Tuple of (batch_status, results). Once the batch has completed, results
+        holds a (feedback_text, estimated_cost) pair per pitch, with an error
+        message for each request that failed; otherwise it is empty.
+    """
+    client = _get_openai_client(os.getenv("OPENAI_API_KEY"))
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed":
+        return batch.status, []
+    
+    model = get_model_for_task("evaluation")
+    completions = {}
+    # A batch where every request failed has only an error file
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if line.strip():
+                result = json.loads(line)
+                completions[result["custom_id"]] = (result.get("response") or {}).get("body")
+    
+    results = []
+    for index, cache_key in enumerate(cache_keys):
+        body = completions.get(f"pitch-{index}")
+        if not body or not body.get("choices"):
+            results.append(("Error generating AI feedback: request failed in batch", 0.0))
+            continue
+        
+        feedback = body["choices"][0]["message"]["content"]
+        usage = body.get("usage") or {}
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+        cost = estimate_cost(model, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0), cached_tokens) * BATCH_DISCOUNT
+        _save_cached_feedback(AI_CACHE_DIR / f"{cache_key}.json", feedback)
+        results.append((feedback, cost))
+    
+    return batch.status, results
\ No newline at end of file
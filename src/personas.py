@@ -1,29 +1,92 @@
+import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+try:
+    import orjson  # optional: faster persona (de)serialization
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(text: str) -> Dict[str, Any]:
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=256)
+def _read_journalist_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read a persona file; keyed on mtime/size so edits are picked up."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
 
 
 def load_journalist(journalist_id: str) -> Dict[str, Any]:
-    """Load a journalist persona from JSON file."""
+    """
+    Load a journalist persona from JSON file.
+    
+    The file contents are cached until the file changes on disk. Each call
+    still parses into a fresh dict, so callers are free to mutate it.
+    `keyword_triggers_lower` is always derived here from `keyword_triggers`.
+    """
     file_path = Path(f"journalists/{journalist_id}.json")
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"Journalist file not found: {file_path}")
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Journalist file not found: {file_path}") from None
+    
+    journalist_data = _loads(_read_journalist_file(str(file_path), stat.st_mtime_ns, stat.st_size))
     
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    journalist_data["keyword_triggers_lower"] = [
+        keyword.lower() for keyword in journalist_data.get("keyword_triggers", [])
+    ]
+    
+    return journalist_data
 
 
 def save_journalist(journalist_id: str, journalist_data: Dict[str, Any]) -> None:
-    """Save a journalist persona to JSON file."""
+    """
+    Save a journalist persona to JSON file.
+    
+    The derived `keyword_triggers_lower` is not written, so hand edits to
+    `keyword_triggers` can't leave a stale copy behind.
+    """
     file_path = Path(f"journalists/{journalist_id}.json")
     
     # Ensure the journalists directory exists
     file_path.parent.mkdir(exist_ok=True)
     
-    with open(file_path, 'w') as f:
-        json.dump(journalist_data, f, indent=2)
+    journalist_data = {
+        key: value for key, value in journalist_data.items() if key != "keyword_triggers_lower"
+    }
+    
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(_dumps(journalist_data))
+
+
+async def aload_journalist(journalist_id: str) -> Dict[str, Any]:
+    """Async variant of `load_journalist`; reads the file in a worker thread."""
+    return await asyncio.to_thread(load_journalist, journalist_id)
+
+
+async def asave_journalist(journalist_id: str, journalist_data: Dict[str, Any]) -> None:
+    """
+    Async variant of `save_journalist`; writes the file in a worker thread.
+    
+    The sync functions remain the default; these are for callers already
+    running on an event loop, so file I/O doesn't block it.
+    """
+    await asyncio.to_thread(save_journalist, journalist_id, journalist_data)
 
 
 def list_journalists() -> List[str]:
@@ -39,4 +102,22 @@ def list_journalists() -> List[str]:
         journalist_id = file_path.stem
         journalist_files.append(journalist_id)
     
-    return sorted(journalist_files)
\ No newline at end of file
+    return sorted(journalist_files)
+
+
+def list_journalists_with_meta() -> List[Tuple[str, str, str]]:
+    """
+    List all journalists as (journalist_id, name, publication) tuples.
+    
+    Scans the directory once and reads the persona files in parallel,
+    since each is a small independent read.
+    """
+    journalist_ids = list_journalists()
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        journalists = list(executor.map(load_journalist, journalist_ids))
+    
+    return [
+        (journalist_id, journalist["name"], journalist["publication"])
+        for journalist_id, journalist in zip(journalist_ids, journalists)
+    ]
@@ -0,0 +1,15 @@
+import pytest
+from src.config import estimate_cost, get_model_for_task
+
+
+def test_estimate_cost_bills_cached_input_at_discount():
+    model = get_model_for_task("evaluation")
+    
+    full_price = estimate_cost(model, 2000, 500)
+    half_cached = estimate_cost(model, 2000, 500, cached_input_tokens=1000)
+    
+    assert 0 < half_cached < full_price
+
+
+def test_estimate_cost_unknown_model_is_free():
+    assert estimate_cost("unknown-model", 1000, 1000) == 0.0
@@ -1,8 +1,31 @@
 import pytest
-from src.evaluation import calculate_response_likelihood
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+from src import evaluation
+from src.evaluation import (
+    calculate_response_likelihood,
+    calculate_response_likelihood_batch,
+    evaluate_pitch_with_ai,
+    evaluate_pitches_concurrently,
+    find_keyword_matches,
+    find_term_groups,
+    get_batch_evaluation_results,
+    stream_pitch_evaluation,
+    submit_batch_evaluation,
+)
 from src.personas import load_journalist
 
 
+@pytest.fixture(autouse=True)
+def fresh_openai_client():
+    # Tests swap in fake clients, so never reuse one across tests
+    evaluation._get_openai_client.cache_clear()
+    yield
+    evaluation._get_openai_client.cache_clear()
+
+
 def test_calculate_response_likelihood_with_multipliers():
     journalist_data = {
         "base_response_rate": 0.1,
@@ -133,4 +156,262 @@ def test_real_journalist_integration():
     
     # Should be much lower
     assert off_beat_likelihood < likelihood
-    assert off_beat_likelihood < 0.1
\ No newline at end of file
+    assert off_beat_likelihood < 0.1
+
+
+def test_calculate_response_likelihood_batch_matches_scalar():
+    journalists = [
+        load_journalist("jane_smith_techcrunch"),
+        {
+            "base_response_rate": 0.3,
+            "response_factors": {"timing": {"breaking_news": 1.5}},
+            "keyword_triggers": ["Sports", "IPO"]
+        },
+        {}
+    ]
+    pitches = [
+        "Exclusive: Major enterprise security breach affects 50,000+ businesses",
+        "Breaking: sports startup files for IPO",
+        "We are pleased to announce a digital innovation product launch",
+        ""
+    ]
+    
+    likelihoods = calculate_response_likelihood_batch(pitches, journalists)
+    
+    assert likelihoods.shape == (len(pitches), len(journalists))
+    for p, pitch in enumerate(pitches):
+        for j, journalist in enumerate(journalists):
+            assert likelihoods[p, j] == calculate_response_likelihood(pitch, journalist)
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_find_keyword_matches(monkeypatch, use_automaton):
+    if use_automaton and not evaluation.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(evaluation, "AHOCORASICK_AVAILABLE", use_automaton)
+    
+    keywords = ["SaaS", "security", "data breach", "IPO"]
+    pitch = "Exclusive: a cybersecurity data breach at a SaaS vendor"
+    
+    # Overlapping matches are found, order and casing follow the keyword list
+    assert find_keyword_matches(pitch.lower(), keywords) == ["SaaS", "security", "data breach"]
+    assert find_keyword_matches(pitch.lower(), []) == []
+    
+    # Terms shared between groups count towards each of them
+    groups = (("data", ("data", "survey")), ("research", ("data", "study")), ("exec", ("ceo",)))
+    assert find_term_groups("new data from our survey", groups) == {"data", "research"}
+
+
+def _fake_openai_client(calls):
+    """Build a stand-in OpenAI client that records each completion request."""
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(content="Strong, well-targeted pitch.")
+        usage = SimpleNamespace(completion_tokens=10)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+    
+    completions = SimpleNamespace(create=create)
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def test_ai_evaluation_served_from_cache_on_repeat(monkeypatch, tmp_path):
+    if not evaluation.OPENAI_V1:
+        pytest.skip("requires openai>=1.0")
+    calls = []
+    monkeypatch.setattr(evaluation, "AI_CACHE_DIR", tmp_path)
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: _fake_openai_client(calls))
+    journalist = load_journalist("jane_smith_techcrunch")
+    pitch = "Exclusive: enterprise security breach data"
+    
+    feedback, cost = evaluate_pitch_with_ai(pitch, journalist)
+    cached_feedback, cached_cost = evaluate_pitch_with_ai(pitch, journalist)
+    reformatted_feedback, _ = evaluate_pitch_with_ai("  " + pitch.replace(" ", " \t ") + "  \n", journalist)
+    
+    assert len(calls) == 1
+    assert reformatted_feedback == feedback
+    
+    # Line breaks change the pitch's structure, so they aren't served from the cache
+    evaluate_pitch_with_ai(pitch.replace(" ", "\n"), journalist)
+    assert len(calls) == 2
+    assert cached_feedback == feedback == "Strong, well-targeted pitch."
+    assert cost > 0
+    assert cached_cost == 0.0
+
+
+def test_ai_evaluation_keeps_journalist_prefix_stable(monkeypatch, tmp_path):
+    if not evaluation.OPENAI_V1:
+        pytest.skip("requires openai>=1.0")
+    calls = []
+    monkeypatch.setattr(evaluation, "AI_CACHE_DIR", tmp_path)
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: _fake_openai_client(calls))
+    journalist = load_journalist("jane_smith_techcrunch")
+    
+    evaluate_pitch_with_ai("Exclusive: enterprise security breach", journalist)
+    evaluate_pitch_with_ai("New SaaS funding round data", journalist)
+    
+    # Same journalist -> identical system message, only the pitch differs
+    first, second = (call["messages"] for call in calls)
+    assert first[0] == second[0]
+    assert calls[0]["extra_body"] == calls[1]["extra_body"]
+    assert journalist["system_prompt"] in first[0]["content"]
+    assert first[1] != second[1]
+
+
+def test_batch_evaluation_round_trip(monkeypatch, tmp_path):
+    if not evaluation.OPENAI_V1:
+        pytest.skip("requires openai>=1.0")
+    uploads = []
+    
+    def create_file(file, purpose):
+        uploads.append(file[1].decode("utf-8"))
+        return SimpleNamespace(id="file-in")
+    
+    def file_content(file_id):
+        # Answer every request but the second, which failed in the batch
+        lines = []
+        for line in uploads[0].splitlines()[::2]:
+            request = json.loads(line)
+            body = {
+                "choices": [{"message": {"content": f"Feedback for {request['custom_id']}"}}],
+                "usage": {"prompt_tokens": 1000, "completion_tokens": 1000}
+            }
+            lines.append(json.dumps({"custom_id": request["custom_id"], "response": {"body": body}}))
+        return SimpleNamespace(text="\n".join(lines))
+    
+    client = SimpleNamespace(
+        files=SimpleNamespace(create=create_file, content=file_content),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="batch-1"),
+            retrieve=lambda batch_id: SimpleNamespace(status="completed", output_file_id="file-out")
+        )
+    )
+    monkeypatch.setattr(evaluation, "AI_CACHE_DIR", tmp_path)
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: client)
+    journalist = load_journalist("jane_smith_techcrunch")
+    pitches = ["Exclusive: enterprise breach", "SaaS funding news", "IPO data"]
+    
+    batch_id, cache_keys = submit_batch_evaluation(pitches, journalist)
+    assert len(cache_keys) == len(pitches)
+    status, results = get_batch_evaluation_results(batch_id, cache_keys)
+    
+    assert status == "completed"
+    assert [feedback for feedback, _ in results][::2] == ["Feedback for pitch-0", "Feedback for pitch-2"]
+    assert results[1] == ("Error generating AI feedback: request failed in batch", 0.0)
+    assert results[0][1] > 0
+    
+    # Completed feedback lands in the cache used by interactive evaluation
+    assert evaluate_pitch_with_ai(pitches[0], journalist) == ("Feedback for pitch-0", 0.0)
+    
+    # ...under the submitted prompt only, not one built from a since-edited persona
+    edited = {**journalist, "system_prompt": journalist["system_prompt"] + " Edited."}
+    model = evaluation.get_model_for_task("evaluation")
+    edited_messages = evaluation._build_evaluation_messages(pitches[0], edited)
+    assert not evaluation._feedback_cache_path(model, edited_messages).exists()
+
+
+@pytest.mark.parametrize("status,expected_results", [
+    ("completed", [("Error generating AI feedback: request failed in batch", 0.0)] * 2),
+    ("failed", []),
+    ("in_progress", []),
+])
+def test_batch_evaluation_without_output(monkeypatch, status, expected_results):
+    # A batch where every request failed completes with only an error file
+    client = SimpleNamespace(
+        batches=SimpleNamespace(
+            retrieve=lambda batch_id: SimpleNamespace(status=status, output_file_id=None, error_file_id="file-err")
+        )
+    )
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: client)
+    
+    assert get_batch_evaluation_results("batch-1", ["key-one", "key-two"]) == (status, expected_results)
+
+
+def test_stream_pitch_evaluation_yields_chunks_and_reports_cost(monkeypatch, tmp_path):
+    if not evaluation.OPENAI_V1:
+        pytest.skip("requires openai>=1.0")
+    
+    def create(**kwargs):
+        assert kwargs["stream"] is True
+        for text in ["Strong ", "pitch."]:
+            delta = SimpleNamespace(content=text)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(completion_tokens=10))
+    
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(evaluation, "AI_CACHE_DIR", tmp_path)
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: client)
+    journalist = load_journalist("jane_smith_techcrunch")
+    
+    result = {}
+    chunks = list(stream_pitch_evaluation("Exclusive: enterprise breach", journalist, result))
+    
+    assert chunks == ["Strong ", "pitch."]
+    assert result["feedback"] == "Strong pitch."
+    assert result["cost"] > 0
+    
+    # Streamed feedback is cached like a regular evaluation
+    cached_result = {}
+    assert list(stream_pitch_evaluation("Exclusive: enterprise breach", journalist, cached_result)) == ["Strong pitch."]
+    assert cached_result["cost"] == 0.0
+
+
+def test_empty_feedback_is_not_cached(monkeypatch, tmp_path):
+    if not evaluation.OPENAI_V1:
+        pytest.skip("requires openai>=1.0")
+    
+    def create(**kwargs):
+        # A stream that ends without any content deltas
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(completion_tokens=0))
+    
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(evaluation, "AI_CACHE_DIR", tmp_path)
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: client)
+    journalist = load_journalist("jane_smith_techcrunch")
+    
+    result = {}
+    assert list(stream_pitch_evaluation("Exclusive: enterprise breach", journalist, result)) == []
+    assert result["feedback"] == ""
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_error_is_reported_separately(monkeypatch, tmp_path):
+    if not evaluation.OPENAI_V1:
+        pytest.skip("requires openai>=1.0")
+    
+    def create(**kwargs):
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Strong "))], usage=None)
+        raise ConnectionError("stream dropped")
+    
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(evaluation, "AI_CACHE_DIR", tmp_path)
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: client)
+    journalist = load_journalist("jane_smith_techcrunch")
+    
+    result = {}
+    chunks = list(stream_pitch_evaluation("Exclusive: enterprise breach", journalist, result))
+    
+    # The error isn't glued onto the streamed text, and partial feedback isn't cached
+    assert chunks == ["Strong "]
+    assert result["feedback"] == "Strong "
+    assert result["error"] == "Error generating AI feedback: stream dropped"
+    assert list(tmp_path.iterdir()) == []
+
+def test_evaluate_pitches_concurrently_preserves_order(monkeypatch):
+    def fake_evaluate(pitch, journalist_data):
+        return f"{journalist_data['name']}: {pitch}", 0.01
+    
+    monkeypatch.setattr(evaluation, "evaluate_pitch_with_ai", fake_evaluate)
+    jane = {"name": "Jane"}
+    john = {"name": "John"}
+    pairs = [("pitch one", jane), ("pitch two", john), ("pitch three", jane)]
+    
+    results = evaluate_pitches_concurrently(pairs, max_workers=3)
+    
+    assert [feedback for feedback, _ in results] == ["Jane: pitch one", "John: pitch two", "Jane: pitch three"]
+    assert evaluate_pitches_concurrently([]) == []
+
+
+def test_import_does_not_load_openai_sdk_or_numpy():
+    # Local scoring should not pay for importing the SDK or NumPy
+    code = "import sys, src.evaluation; sys.exit('openai' in sys.modules or 'numpy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
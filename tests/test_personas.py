@@ -1,8 +1,17 @@
 import pytest
+import asyncio
 import json
 import os
 from pathlib import Path
-from src.personas import load_journalist, save_journalist, list_journalists
+from src.personas import (
+    aload_journalist,
+    asave_journalist,
+    list_journalists,
+    list_journalists_with_meta,
+    load_journalist,
+    save_journalist,
+)
+from src import personas
 
 
 def test_load_journalist_from_json():
@@ -78,6 +87,7 @@ def test_save_journalist():
     loaded = load_journalist("test_reporter")
     assert loaded["name"] == "Test Reporter"
     assert loaded["publication"] == "Test Daily"
+    assert loaded["keyword_triggers_lower"] == ["test", "qa"]
     
     # Clean up
     os.remove("journalists/test_reporter.json")
@@ -88,4 +98,76 @@ def test_list_journalists():
     
     assert isinstance(journalists, list)
     assert len(journalists) > 0
-    assert "jane_smith_techcrunch" in journalists
\ No newline at end of file
+    assert "jane_smith_techcrunch" in journalists
+
+
+def test_list_journalists_with_meta():
+    entries = list_journalists_with_meta()
+    
+    assert [journalist_id for journalist_id, _, _ in entries] == list_journalists()
+    assert ("jane_smith_techcrunch", "Jane Smith", "TechCrunch") in entries
+
+
+def test_load_journalist_picks_up_changes_and_returns_copies():
+    test_journalist = {"name": "Test Reporter", "publication": "Test Daily", "keyword_triggers": []}
+    save_journalist("test_reporter", test_journalist)
+    
+    try:
+        loaded = load_journalist("test_reporter")
+        loaded["name"] = "Mutated"
+        assert load_journalist("test_reporter")["name"] == "Test Reporter"
+        
+        save_journalist("test_reporter", {**test_journalist, "name": "Renamed Reporter"})
+        assert load_journalist("test_reporter")["name"] == "Renamed Reporter"
+    finally:
+        os.remove("journalists/test_reporter.json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_load_round_trip(monkeypatch, use_orjson):
+    if use_orjson and not personas.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(personas, "ORJSON_AVAILABLE", use_orjson)
+    
+    test_journalist = {
+        "name": "Test Reporter",
+        "publication": "Test Daily",
+        "response_factors": {"timing": {"breaking_news": 2.0}},
+        "keyword_triggers": ["Test", "QA"]
+    }
+    save_journalist("test_reporter", test_journalist)
+    
+    try:
+        with open("journalists/test_reporter.json") as f:
+            saved = json.load(f)
+        assert saved["response_factors"] == {"timing": {"breaking_news": 2.0}}
+        assert "keyword_triggers_lower" not in saved
+        assert load_journalist("test_reporter")["keyword_triggers_lower"] == ["test", "qa"]
+    finally:
+        os.remove("journalists/test_reporter.json")
+
+
+def test_load_journalist_derives_lowercased_keywords():
+    # A stale lowercase list left in the file must not win over keyword_triggers
+    with open("journalists/test_reporter.json", "w") as f:
+        json.dump({"name": "Test Reporter", "keyword_triggers": ["SaaS", "IPO"], "keyword_triggers_lower": ["saas"]}, f)
+    
+    try:
+        assert load_journalist("test_reporter")["keyword_triggers_lower"] == ["saas", "ipo"]
+    finally:
+        os.remove("journalists/test_reporter.json")
+
+
+def test_async_save_and_load():
+    test_journalist = {"name": "Test Reporter", "publication": "Test Daily", "keyword_triggers": ["QA"]}
+    
+    async def round_trip():
+        await asave_journalist("test_reporter", test_journalist)
+        return await aload_journalist("test_reporter")
+    
+    try:
+        loaded = asyncio.run(round_trip())
+        assert loaded["name"] == "Test Reporter"
+        assert loaded["keyword_triggers_lower"] == ["qa"]
+    finally:
+        os.remove("journalists/test_reporter.json")